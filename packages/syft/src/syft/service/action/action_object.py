@@ -18,6 +18,7 @@ from typing import ClassVar
 from typing import TYPE_CHECKING
 
 # third party
+import numpy as np
 from pydantic import ConfigDict
 from pydantic import Field
 from pydantic import field_validator
@@ -717,14 +718,20 @@ class ActionObject(SyncableSyftObject):
 
         try:
             cmp = low_data != high_data
-            if isinstance(cmp, Iterable):
+            if isinstance(cmp, np.ndarray) and cmp.ndim == 1:
+                # same result as all(cmp), without iterating the array in python
+                cmp = bool(cmp.all())
+            elif isinstance(cmp, Iterable):
                 cmp = all(cmp)
         except Exception:
             cmp = False
 
         if cmp:
-            diff_attr = AttrDiff(
-                attr_name="syft_action_data", low_attr=low_data, high_attr=high_data
+            diff_attr = AttrDiff.model_construct(
+                id=UID(),
+                attr_name="syft_action_data",
+                low_attr=low_data,
+                high_attr=high_data,
             )
             diff_attrs.append(diff_attr)
         return diff_attrs
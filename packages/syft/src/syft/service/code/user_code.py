@@ -124,11 +124,12 @@ class UserCodeStatusCollection(SyncableSyftObject):
         from ...service.sync.diff_state import AttrDiff
 
         diff_attrs = []
-        status = list(self.status_dict.values())[0]
-        ext_status = list(ext_obj.status_dict.values())[0]
+        status = next(iter(self.status_dict.values()), None)
+        ext_status = next(iter(ext_obj.status_dict.values()), None)
 
         if status != ext_status:
-            diff_attr = AttrDiff(
+            diff_attr = AttrDiff.model_construct(
+                id=UID(),
                 attr_name="status_dict",
                 low_attr=status,
                 high_attr=ext_status,
@@ -140,7 +141,8 @@ class UserCodeStatusCollection(SyncableSyftObject):
         return str(self.status_dict)
 
     def _repr_html_(self) -> str:
-        string = f"""
+        parts = [
+            f"""
             <style>
                 .syft-user_code {{color: {SURFACE[options.color_theme]};}}
                 </style>
@@ -148,25 +150,28 @@ class UserCodeStatusCollection(SyncableSyftObject):
                     <h3 style="line-height: 25%; margin-top: 25px;">User Code Status</h3>
                     <p style="margin-left: 3px;">
             """
+        ]
         for node_identity, (status, reason) in self.status_dict.items():
             node_name_str = f"{node_identity.node_name}"
             uid_str = f"{node_identity.node_id}"
             status_str = f"{status.value}"
-            string += f"""
+            parts.append(
+                f"""
                     &#x2022; <strong>UID: </strong>{uid_str}&nbsp;
                     <strong>Node name: </strong>{node_name_str}&nbsp;
                     <strong>Status: </strong>{status_str};
                     <strong>Reason: </strong>{reason}
                     <br>
                 """
-        string += "</p></div>"
-        return string
+            )
+        parts.append("</p></div>")
+        return "".join(parts)
 
     def __repr_syft_nested__(self) -> str:
-        string = ""
-        for node_identity, (status, reason) in self.status_dict.items():
-            string += f"{node_identity.node_name}: {status}, {reason}<br>"
-        return string
+        return "".join(
+            f"{node_identity.node_name}: {status}, {reason}<br>"
+            for node_identity, (status, reason) in self.status_dict.items()
+        )
 
     def get_status_message(self) -> SyftSuccess | SyftNotReady | SyftError:
         if self.approved:
@@ -29,7 +29,9 @@ from ...store.linked_obj import LinkedObject
 from ...types.datetime import DateTime
 from ...types.identity import Identity
 from ...types.identity import UserIdentity
+from ...types.syft_migration import migrate
 from ...types.syft_object import SYFT_OBJECT_VERSION_2
+from ...types.syft_object import SYFT_OBJECT_VERSION_3
 from ...types.syft_object import SyftObject
 from ...types.syft_object import short_qual_name
 from ...types.transforms import TransformContext
@@ -54,6 +56,10 @@ from ..response import SyftSuccess
 from ..user.user import UserView
 
 
+# Tag byte prepended to a member's raw verify key in project_permissions
+PROJECT_OWNER_TAG = b"\x01"
+
+
 @serializable()
 class EventAlreadyAddedException(SyftException):
     pass
@@ -653,13 +659,47 @@ def add_code_request_to_project(
 
 
 @serializable()
-class Project(SyftObject):
+class ProjectV2(SyftObject):
     __canonical_name__ = "Project"
     __version__ = SYFT_OBJECT_VERSION_2
 
     __repr_attrs__ = ["name", "description", "created_by"]
     __attr_unique__ = ["name"]
 
+    __hash_exclude_attrs__ = [
+        "user_signing_key",
+        "start_hash",
+        "users",
+        "members",
+        "leader_node_peer",
+        "event_id_hashmap",
+    ]
+
+    id: UID | None = None  # type: ignore[assignment]
+    name: str
+    description: str | None = None
+    members: list[NodeIdentity]
+    users: list[UserIdentity] = []
+    username: str | None = None
+    created_by: str
+    start_hash: str | None = None
+    user_signing_key: SyftSigningKey | None = None
+    events: list[ProjectEvent] = []
+    event_id_hashmap: dict[UID, ProjectEvent] = {}
+    state_sync_leader: NodeIdentity
+    leader_node_peer: NodePeer | None = None
+    consensus_model: ConsensusModel
+    project_permissions: set[str]
+
+
+@serializable()
+class Project(SyftObject):
+    __canonical_name__ = "Project"
+    __version__ = SYFT_OBJECT_VERSION_3
+
+    __repr_attrs__ = ["name", "description", "created_by"]
+    __attr_unique__ = ["name"]
+
     # TODO: re-add users, members, leader_node_peer
     __hash_exclude_attrs__ = [
         "user_signing_key",
@@ -691,7 +731,7 @@ class Project(SyftObject):
 
     # Unused
     consensus_model: ConsensusModel
-    project_permissions: set[str]
+    project_permissions: frozenset[bytes]
     # store: Dict[UID, Dict[UID, SyftObject]] = {}
     # permissions: Dict[UID, Dict[UID, Set[str]]] = {}
 
@@ -1138,7 +1178,7 @@ class Project(SyftObject):
 
 
 @serializable(without=["bootstrap_events", "clients"])
-class ProjectSubmit(SyftObject):
+class ProjectSubmitV2(SyftObject):
     __canonical_name__ = "ProjectSubmit"
     __version__ = SYFT_OBJECT_VERSION_2
 
@@ -1151,6 +1191,39 @@ class ProjectSubmit(SyftObject):
         "bootstrap_events",
     ]
 
+    __repr_attrs__ = ["name", "description", "created_by"]
+    __attr_unique__ = ["name"]
+
+    id: UID
+    name: str
+    description: str | None = None
+    members: list[SyftClient] | list[NodeIdentity]
+    users: list[UserIdentity] = []
+    created_by: str | None = None
+    username: str | None = None
+    clients: list[SyftClient] = []
+    start_hash: str = ""
+    leader_node_route: NodeRoute | None = None
+    state_sync_leader: NodeIdentity | None = None
+    bootstrap_events: list[ProjectEvent] | None = []
+    project_permissions: set[str] = set()
+    consensus_model: ConsensusModel = DemocraticConsensusModel()
+
+
+@serializable(without=["bootstrap_events", "clients"])
+class ProjectSubmit(SyftObject):
+    __canonical_name__ = "ProjectSubmit"
+    __version__ = SYFT_OBJECT_VERSION_3
+
+    __hash_exclude_attrs__ = [
+        "start_hash",
+        "users",
+        "members",
+        "clients",
+        "leader_node_route",
+        "bootstrap_events",
+    ]
+
     # stash rules
     __repr_attrs__ = ["name", "description", "created_by"]
     __attr_unique__ = ["name"]
@@ -1175,7 +1248,7 @@ class ProjectSubmit(SyftObject):
     bootstrap_events: list[ProjectEvent] | None = []
 
     # Unused at the moment
-    project_permissions: set[str] = set()
+    project_permissions: frozenset[bytes] = frozenset()
     consensus_model: ConsensusModel = DemocraticConsensusModel()
 
     def __init__(self, *args: Any, **kwargs: Any):
@@ -1335,50 +1408,73 @@ class ProjectSubmit(SyftObject):
                 raise SyftException(result.message)
 
 
-def add_members_as_owners(members: list[SyftVerifyKey]) -> set[str]:
-    keys = set()
-    for member in members:
-        owner_key = f"OWNER_{member.verify_key}"
-        keys.add(owner_key)
-    return keys
+def add_members_as_owners(members: list[NodeIdentity]) -> frozenset[bytes]:
+    return frozenset(
+        PROJECT_OWNER_TAG + bytes(member.verify_key.verify_key) for member in members
+    )
 
 
-def elect_leader(context: TransformContext) -> TransformContext:
-    if context.output is not None:
-        if len(context.output["members"]) == 0:
-            raise ValueError("Project's require at least one member")
-        context.output["state_sync_leader"] = context.output["members"][0]
+def elect_leader_and_set_owners(context: TransformContext) -> TransformContext:
+    # Single pass over the submitted project: elect the leader, make the
+    # members owners if no permissions were given and record the creator name
+    if context.output is None:
+        return context
+
+    members = context.output["members"]
+    if len(members) == 0:
+        raise ValueError("Project's require at least one member")
+    context.output["state_sync_leader"] = members[0]
+
+    if len(context.output["project_permissions"]) == 0:
+        context.output["project_permissions"] = add_members_as_owners(members)
+
+    if context.obj is not None:
+        context.output["username"] = context.obj.username
 
     return context
 
 
-def check_permissions(context: TransformContext) -> TransformContext:
-    if context.output is None:
-        return context
+@transform(ProjectSubmit, Project)
+def new_projectsubmit_to_project() -> list[Callable]:
+    return [elect_leader_and_set_owners]
 
-    if len(context.output["members"]) > 1:
-        # more than 1 node
-        pass
-    # check at least one owner
-    if len(context.output["project_permissions"]) == 0:
-        project_permissions = context.output["project_permissions"]
-        project_permissions = project_permissions.union(
-            add_members_as_owners(context.output["members"])
-        )
-        context.output["project_permissions"] = project_permissions
 
+def _owner_strs_to_bytes(context: TransformContext) -> TransformContext:
+    if context.output is not None:
+        context.output["project_permissions"] = frozenset(
+            PROJECT_OWNER_TAG + bytes.fromhex(p.removeprefix("OWNER_"))
+            for p in context.output["project_permissions"]
+        )
     return context
 
 
-def add_creator_name(context: TransformContext) -> TransformContext:
-    if context.output is not None and context.obj is not None:
-        context.output["username"] = context.obj.username
+def _owner_bytes_to_strs(context: TransformContext) -> TransformContext:
+    if context.output is not None:
+        context.output["project_permissions"] = {
+            f"OWNER_{p[len(PROJECT_OWNER_TAG):].hex()}"
+            for p in context.output["project_permissions"]
+        }
     return context
 
 
-@transform(ProjectSubmit, Project)
-def new_projectsubmit_to_project() -> list[Callable]:
-    return [elect_leader, check_permissions, add_creator_name]
+@migrate(ProjectV2, Project)
+def upgrade_project() -> list[Callable]:
+    return [_owner_strs_to_bytes]
+
+
+@migrate(Project, ProjectV2)
+def downgrade_project() -> list[Callable]:
+    return [_owner_bytes_to_strs]
+
+
+@migrate(ProjectSubmitV2, ProjectSubmit)
+def upgrade_project_submit() -> list[Callable]:
+    return [_owner_strs_to_bytes]
+
+
+@migrate(ProjectSubmit, ProjectSubmitV2)
+def downgrade_project_submit() -> list[Callable]:
+    return [_owner_bytes_to_strs]
 
 
 def hash_object(obj: Any) -> tuple[bytes, str]:
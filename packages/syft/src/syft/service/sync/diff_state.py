@@ -1,5 +1,9 @@
 # stdlib
+from collections import defaultdict
+from functools import lru_cache
 import html
+from itertools import chain
+from operator import attrgetter
 import textwrap
 from typing import Any
 from typing import ClassVar
@@ -14,6 +18,7 @@ from rich.console import Group
 from rich.markdown import Markdown
 from rich.padding import Padding
 from rich.panel import Panel
+from rich.syntax import Syntax
 from typing_extensions import Self
 
 # relative
@@ -52,6 +57,11 @@ from ..response import SyftSuccess
 from .sync_state import SyncState
 
 sketchy_tab = "‎ " * 4
+_TAB_CACHE = [sketchy_tab * i for i in range(32)]
+
+
+def _tabs(num_tabs: int) -> str:
+    return _TAB_CACHE[num_tabs] if num_tabs < 32 else sketchy_tab * num_tabs
 
 
 class AttrDiff(SyftObject):
@@ -120,7 +130,9 @@ class ListDiff(AttrDiff):
             elif low_list[i] != high_list[i]:
                 diff_ids.append(i)
 
-        change_diff = ListDiff(
+        # inputs are already typed, skip pydantic validation
+        change_diff = ListDiff.model_construct(
+            id=UID(),
             attr_name=attr_name,
             low_attr=low_list,
             high_attr=high_list,
@@ -138,18 +150,19 @@ def recursive_attr_repr(value_attr: list | dict | bytes, num_tabs: int = 0) -> s
         if len(value_attr) == 1:
             value_attr = value_attr[0]
         else:
-            list_repr = "[\n"
+            list_parts = ["[\n"]
             for elem in value_attr:
-                list_repr += recursive_attr_repr(elem, num_tabs=num_tabs + 1) + "\n"
-            list_repr += "]"
-            return list_repr
+                list_parts.append(recursive_attr_repr(elem, num_tabs=num_tabs + 1))
+                list_parts.append("\n")
+            list_parts.append("]")
+            return "".join(list_parts)
 
     elif isinstance(value_attr, dict):
-        dict_repr = "{\n"
+        dict_parts = ["{\n"]
         for key, elem in value_attr.items():
-            dict_repr += f"{sketchy_tab * new_num_tabs}{key}: {str(elem)}\n"
-        dict_repr += "}"
-        return dict_repr
+            dict_parts.append(f"{_tabs(new_num_tabs)}{key}: {str(elem)}\n")
+        dict_parts.append("}")
+        return "".join(dict_parts)
 
     elif isinstance(value_attr, bytes):
         value_attr = repr(value_attr)  # type: ignore
@@ -159,7 +172,40 @@ def recursive_attr_repr(value_attr: list | dict | bytes, num_tabs: int = 0) -> s
     if isinstance(value_attr, UID):
         value_attr = short_uid(value_attr)  # type: ignore
 
-    return f"{sketchy_tab*num_tabs}{str(value_attr)}"
+    if num_tabs == 0:
+        return str(value_attr)
+    return f"{_tabs(num_tabs)}{str(value_attr)}"
+
+
+def _repr_attr_items(
+    obj: Any, repr_attrs: list[str] | None = None
+) -> list[tuple[str, Any]]:
+    """(attr, value) pairs for the __repr_attrs__ of obj, fetched in one call"""
+    if repr_attrs is None:
+        repr_attrs = getattr(type(obj), "__repr_attrs__", [])
+    if not repr_attrs:
+        return []
+    values = attrgetter(*repr_attrs)(obj)
+    # attrgetter returns a bare value, not a tuple, for a single attribute
+    if len(repr_attrs) == 1:
+        values = (values,)
+    return list(zip(repr_attrs, values))
+
+
+@lru_cache(maxsize=8)
+def _diff_html_prologue(color_theme: str) -> str:
+    # the css block is identical for every diff rendered with the same theme
+    return f"""
+        <style>
+        {FONT_CSS}
+        .syft-dataset {{color: {SURFACE[color_theme]};}}
+        .syft-dataset h3,
+        .syft-dataset p
+            {{font-family: 'Open Sans';}}
+            {ITABLES_CSS}
+        </style>
+        <div class='syft-diff'>
+        """
 
 
 class ObjectDiff(SyftObject):  # StateTuple (compare 2 objects)
@@ -182,6 +228,8 @@ class ObjectDiff(SyftObject):  # StateTuple (compare 2 objects)
     obj_type: type
     diff_list: list[AttrDiff] = []
 
+    _hash: int | None = None
+
     __repr_attrs__ = [
         "low_state",
         "high_state",
@@ -232,7 +280,10 @@ class ObjectDiff(SyftObject):  # StateTuple (compare 2 objects)
             raise ValueError("Both low and high objects are None")
         obj_type = type(low_obj if low_obj is not None else high_obj)
 
-        res = cls(
+        # called once per synced object with data from the sync states,
+        # so skip pydantic validation
+        res = cls.model_construct(
+            id=UID(),
             low_obj=low_obj,
             high_obj=high_obj,
             low_status=low_status,
@@ -240,8 +291,8 @@ class ObjectDiff(SyftObject):  # StateTuple (compare 2 objects)
             obj_type=obj_type,
             low_node_uid=low_node_uid,
             high_node_uid=high_node_uid,
-            low_permissions=low_permissions,
-            high_permissions=high_permissions,
+            low_permissions=list(low_permissions),
+            high_permissions=list(high_permissions),
             low_storage_permissions=low_storage_permissions,
             high_storage_permissions=high_storage_permissions,
             last_sync_date_low=last_sync_date_low,
@@ -262,7 +313,11 @@ class ObjectDiff(SyftObject):  # StateTuple (compare 2 objects)
         return res
 
     def __hash__(self) -> int:
-        return hash(self.object_id) + hash(self.low_obj) + hash(self.high_obj)
+        # content based, batch hashes are stored to detect changes to ignored batches.
+        # Hashing a SyftObject serializes it, so compute this once per diff
+        if self._hash is None:
+            self._hash = hash(self.object_id) + hash(self.low_obj) + hash(self.high_obj)
+        return self._hash
 
     @property
     def last_sync_date(self) -> DateTime | None:
@@ -286,16 +341,15 @@ class ObjectDiff(SyftObject):  # StateTuple (compare 2 objects)
 
     @property
     def object_id(self) -> UID:
-        uid: UID | LineageID = (
-            self.low_obj.id if self.low_obj is not None else self.high_obj.id  # type: ignore
-        )
+        uid: UID | LineageID = self.non_empty_object.id  # type: ignore
         if isinstance(uid, LineageID):
             return uid.id
         return uid
 
     @property
     def non_empty_object(self) -> SyftObject | None:
-        return self.low_obj or self.high_obj
+        # compare against None, ActionObject truthiness is that of its value
+        return self.low_obj if self.low_obj is not None else self.high_obj
 
     @property
     def object_type(self) -> str:
@@ -311,14 +365,21 @@ class ObjectDiff(SyftObject):  # StateTuple (compare 2 objects)
 
     @property
     def object_uid(self) -> UID:
-        return self.low_obj.id if self.low_obj is not None else self.high_obj.id  # type: ignore
+        return self.non_empty_object.id  # type: ignore
 
-    def repr_attr_diffstatus_dict(self) -> dict:
+    def repr_attr_diffstatus_dict(
+        self,
+        low_attrs: dict[str, Any] | None = None,
+        high_attrs: dict[str, Any] | None = None,
+    ) -> dict:
         # relative
         from .resolve_widget import DiffStatus
 
-        low_attrs = self.repr_attr_dict("low")
-        high_attrs = self.repr_attr_dict("high")
+        # callers that already hold the repr_attr_dicts can pass them in
+        if low_attrs is None:
+            low_attrs = self.repr_attr_dict("low")
+        if high_attrs is None:
+            high_attrs = self.repr_attr_dict("high")
         all_attrs = set(low_attrs.keys()) | set(high_attrs.keys())
 
         res = {}
@@ -346,12 +407,7 @@ class ObjectDiff(SyftObject):  # StateTuple (compare 2 objects)
         obj = self.low_obj if side == "low" else self.high_obj
         if isinstance(obj, ActionObject):
             return {"value": obj.syft_action_data_cache}
-        repr_attrs = getattr(obj, "__repr_attrs__", [])
-        res = {}
-        for attr in repr_attrs:
-            value = getattr(obj, attr)
-            res[attr] = value
-        return res
+        return dict(_repr_attr_items(obj))
 
     def diff_attributes_str(self, side: str) -> str:
         obj = self.low_obj if side == "low" else self.high_obj
@@ -359,22 +415,21 @@ class ObjectDiff(SyftObject):  # StateTuple (compare 2 objects)
         if obj is None:
             return ""
 
-        repr_attrs = getattr(obj, "__repr_attrs__", [])
+        repr_attrs = getattr(type(obj), "__repr_attrs__", [])
         if self.status == "SAME":
             repr_attrs = repr_attrs[:3]
 
         if self.status in {"SAME", "NEW"}:
-            attrs_str = ""
-            for attr in repr_attrs:
-                value = getattr(obj, attr)
-                attrs_str += f"{attr}: {recursive_attr_repr(value)}\n"
-            return attrs_str
+            return "".join(
+                f"{attr}: {recursive_attr_repr(value)}\n"
+                for attr, value in _repr_attr_items(obj, repr_attrs)
+            )
 
         elif self.status == "MODIFIED":
-            attrs_str = ""
-            for diff in self.diff_list:
-                attrs_str += f"{diff.attr_name}: {diff.__repr_side__(side)}\n"
-            return attrs_str
+            return "".join(
+                f"{diff.attr_name}: {diff.__repr_side__(side)}\n"
+                for diff in self.diff_list
+            )
         else:
             raise ValueError("")
 
@@ -404,121 +459,100 @@ class ObjectDiff(SyftObject):  # StateTuple (compare 2 objects)
             return obj.__repr__()
 
         if other_obj is None:  # type: ignore[unreachable]
-            attrs_str = ""
-            attrs = getattr(obj, "__repr_attrs__", [])
-            for attr in attrs:
-                value = getattr(obj, attr)
-                attrs_str += f"{sketchy_tab}{attr} = {recursive_attr_repr(value)}\n"
-            attrs_str = attrs_str[:-1]
-            return f"NEW\n\nclass {self.object_type}:\n{attrs_str}"
-
-        attr_text = f"DIFF\nclass {self.object_type}:\n"
-        for diff in self.diff_list:
-            # TODO
-            attr_text += (
-                f"{sketchy_tab}{diff.attr_name}={diff.__repr_side__(side)}," + "\n"
+            attrs_str = "\n".join(
+                f"{sketchy_tab}{attr} = {recursive_attr_repr(value)}"
+                for attr, value in _repr_attr_items(obj)
             )
-        if len(self.diff_list) > 0:
-            attr_text = attr_text[:-2]
+            return f"NEW\n\nclass {self.object_type}:\n{attrs_str}"
 
-        return attr_text
+        # TODO
+        diffs_str = ",\n".join(
+            f"{sketchy_tab}{diff.attr_name}={diff.__repr_side__(side)}"
+            for diff in self.diff_list
+        )
+        return f"DIFF\nclass {self.object_type}:\n{diffs_str}"
 
     def get_obj(self) -> SyftObject | None:
         if self.status == "NEW":
-            return self.low_obj if self.low_obj is not None else self.high_obj
+            return self.non_empty_object
         else:
             raise ValueError("Cannot get object from a diff that is not new")
 
     def _coll_repr_(self) -> dict[str, Any]:
-        low_state = f"{self.status}\n{self.diff_side_str('low')}"
-        high_state = f"{self.status}\n{self.diff_side_str('high')}"
+        # status is NEW/SAME/MODIFIED, only the side string needs escaping
         return {
-            "low_state": html.escape(low_state),
-            "high_state": html.escape(high_state),
+            "low_state": f"{self.status}\n{html.escape(self.diff_side_str('low'))}",
+            "high_state": f"{self.status}\n{html.escape(self.diff_side_str('high'))}",
         }
 
     def _repr_html_(self) -> str:
         if self.low_obj is None and self.high_obj is None:
             return SyftError(message="Something broke")
 
-        base_str = f"""
-        <style>
-        {FONT_CSS}
-        .syft-dataset {{color: {SURFACE[options.color_theme]};}}
-        .syft-dataset h3,
-        .syft-dataset p
-            {{font-family: 'Open Sans';}}
-            {ITABLES_CSS}
-        </style>
-        <div class='syft-diff'>
-        """
-
-        obj_repr: str
-        attr_text: str
-        if self.low_obj is None:
-            if hasattr(self.high_obj, "_repr_html_"):
-                obj_repr = self.high_obj._repr_html_()  # type: ignore
-            elif hasattr(self.high_obj, "_inner_repr"):
-                obj_repr = self.high_obj._inner_repr()  # type: ignore
-            else:
-                obj_repr = self.__repr__()
-            attr_text = (
-                f"""
-    <h3>{self.object_type} ObjectDiff (New {self.object_type}  on the High Side):</h3>
-    """
-                + obj_repr
-            )
+        base_str = _diff_html_prologue(options.color_theme)
 
-        elif self.high_obj is None:
-            if hasattr(self.low_obj, "_repr_html_"):
-                obj_repr = self.low_obj._repr_html_()  # type: ignore
-            elif hasattr(self.low_obj, "_inner_repr"):
-                obj_repr = self.low_obj._inner_repr()  # type: ignore
+        header = f"<h3>{self.object_type} ObjectDiff:</h3>\n"
+        if self.low_obj is None or self.high_obj is None:
+            new_side = "High" if self.low_obj is None else "Low"
+            obj = self.non_empty_object
+            if hasattr(obj, "_repr_html_"):
+                obj_repr = obj._repr_html_()  # type: ignore
+            elif hasattr(obj, "_inner_repr"):
+                obj_repr = obj._inner_repr()  # type: ignore
             else:
                 obj_repr = self.__repr__()
-            attr_text = (
-                f"""
-    <h3>{self.object_type} ObjectDiff (New {self.object_type}  on the High Side):</h3>
-    """
-                + obj_repr
-            )
-
+            header = f"""
+    <h3>{self.object_type} ObjectDiff (New {self.object_type}  on the {new_side} Side):</h3>
+    """  # noqa: E501
         elif self.status == "SAME":
             obj_repr = "No changes between low side and high side"
         else:
-            obj_repr = ""
-            for diff in self.diff_list:
-                obj_repr += diff.__repr__() + "<br>"
-
-            obj_repr = obj_repr.replace("\n", "<br>")
-            # print("New lines", res)
+            obj_repr = "".join(
+                f"{diff!r}<br>".replace("\n", "<br>") for diff in self.diff_list
+            )
 
-        attr_text = f"<h3>{self.object_type} ObjectDiff:</h3>\n{obj_repr}"
-        return base_str + attr_text
+        return "".join([base_str, header, obj_repr])
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}[{self.obj_type.__name__}](#{str(self.object_id)})"
 
 
+@lru_cache(maxsize=32)
+def _get_text_wrapper(width: int, indent: int) -> textwrap.TextWrapper:
+    return textwrap.TextWrapper(
+        width=width,
+        break_long_words=False,
+        replace_whitespace=False,
+        subsequent_indent=" " * indent,
+    )
+
+
 def _wrap_text(text: str, width: int, indent: int = 4) -> str:
     """Wrap text, preserving existing line breaks"""
+    wrapper = _get_text_wrapper(width, indent)
     return "\n".join(
-        [
-            "\n".join(
-                textwrap.wrap(
-                    line,
-                    width,
-                    break_long_words=False,
-                    replace_whitespace=False,
-                    subsequent_indent=" " * indent,
-                )
-            )
-            for line in text.splitlines()
-            if line.strip() != ""
-        ]
+        "\n".join(wrapper.wrap(line))
+        for line in text.splitlines()
+        if line.strip() != ""
     )
 
 
+# root object type -> (visual root type, child types per type)
+_VISUAL_HIERARCHIES: dict[type, tuple[type, dict]] = {
+    Request: (Request, {Request: [UserCode]}),
+    UserCode: (UserCode, {UserCode: [UserCodeStatusCollection, UserCode]}),
+    Job: (
+        UserCode,
+        {
+            UserCode: [ExecutionOutput, UserCode],
+            ExecutionOutput: [Job],
+            Job: [ActionObject, SyftLog, Job],
+        },
+    ),
+    TwinAPIEndpoint: (TwinAPIEndpoint, {TwinAPIEndpoint: []}),
+}
+
+
 class ObjectDiffBatch(SyftObject):
     __canonical_name__ = "DiffHierarchy"
     __version__ = SYFT_OBJECT_VERSION_2
@@ -651,10 +685,10 @@ class ObjectDiffBatch(SyftObject):
         if self.root_diff.status == "NEW":
             return "NEW"
 
-        batch_statuses = [
-            diff.status for diff in self.get_dependents(include_roots=False)
-        ]
-        if all(status == "SAME" for status in batch_statuses):
+        # stop at the first changed dependent
+        if all(
+            diff.status == "SAME" for diff in self.get_dependents(include_roots=False)
+        ):
             return "SAME"
 
         return "MODIFIED"
@@ -734,47 +768,40 @@ class ObjectDiffBatch(SyftObject):
         user_verify_key_high: SyftVerifyKey,
         sync_direction: SyncDirection,
     ) -> "ObjectDiffBatch":
-        def _build_hierarchy_helper(
-            uid: UID, level: int = 0, visited: set | None = None
-        ) -> list:
-            visited = visited if visited is not None else set()
-
-            if uid in visited:
-                return []
-
-            result = [(uid, level)]
-            visited.add(uid)
-            if uid in obj_dependencies:
-                deps = obj_dependencies[uid]
-                for dep_uid in obj_dependencies[uid]:
+        # Iterative depth-first walk, each entry carries the set of uids that
+        # may not appear below it.
+        # NOTE children get visited + deps of their parent, to have
+        # all objects at the highest level in the hierarchy
+        # Example:
+        # ExecutionOutput
+        # -- Job
+        # ---- Result
+        # -- Result
+        # We want to omit Job.Result, because it's already in ExecutionOutput.Result
+        batch_uids: list[tuple[UID, int]] = []
+        stack: list[tuple[UID, int, set[UID]]] = [(root_uid, 0, {root_uid})]
+        while stack:
+            uid, level, visited = stack.pop()
+            batch_uids.append((uid, level))
+            deps = obj_dependencies.get(uid)
+            if deps:
+                child_visited = visited | set(deps)
+                # reversed, so the first dependency is popped first
+                for dep_uid in reversed(deps):
                     if dep_uid not in visited:
-                        # NOTE we pass visited + deps to recursive calls, to have
-                        # all objects at the highest level in the hierarchy
-                        # Example:
-                        # ExecutionOutput
-                        # -- Job
-                        # ---- Result
-                        # -- Result
-                        # We want to omit Job.Result, because it's already in ExecutionOutput.Result
-                        result.extend(
-                            _build_hierarchy_helper(
-                                uid=dep_uid,
-                                level=level + 1,
-                                visited=visited | set(deps) - {dep_uid},
-                            )
-                        )
-            return result
+                        stack.append((dep_uid, level + 1, child_visited))
 
-        batch_uids = _build_hierarchy_helper(root_uid)
         # levels in the tree that we create
         levels = [level for _, level in batch_uids]
 
-        batch_uids = {uid for uid, _ in batch_uids}  # type: ignore
+        batch_uid_set = {uid for uid, _ in batch_uids}
         batch_dependencies = {
-            uid: [d for d in obj_dependencies.get(uid, []) if d in batch_uids]
-            for uid in batch_uids
+            uid: [d for d in obj_dependencies.get(uid, []) if d in batch_uid_set]
+            for uid in batch_uid_set
         }
-        return cls(
+        # model_construct skips validators, so build the dependents explicitly
+        batch = cls.model_construct(
+            id=UID(),
             global_diffs=obj_uid_to_diff,
             global_roots=root_ids,
             hierarchy_levels=levels,
@@ -786,6 +813,7 @@ class ObjectDiffBatch(SyftObject):
             user_verify_key_high=user_verify_key_high,
             sync_direction=sync_direction,
         )
+        return batch.make_dependents()
 
     def flatten_visual_hierarchy(self) -> list[ObjectDiff]:
         def flatten_dict(d: dict) -> list:
@@ -845,30 +873,15 @@ class ObjectDiffBatch(SyftObject):
 
     @property
     def visual_hierarchy(self) -> tuple[type, dict]:
-        # Returns
-        root_obj = (
-            self.root.low_obj if self.root.low_obj is not None else self.root.high_obj
-        )
-        if isinstance(root_obj, Request):
-            return Request, {
-                Request: [UserCode],
-            }
-        elif isinstance(root_obj, UserCode):
-            return UserCode, {  # type: ignore
-                UserCode: [UserCodeStatusCollection, UserCode],
-            }
-        elif isinstance(root_obj, Job):
-            return UserCode, {  # type: ignore
-                UserCode: [ExecutionOutput, UserCode],
-                ExecutionOutput: [Job],
-                Job: [ActionObject, SyftLog, Job],
-            }
-        elif isinstance(root_obj, TwinAPIEndpoint):
-            return TwinAPIEndpoint, {  # type: ignore
-                TwinAPIEndpoint: [],
-            }
-        else:
-            raise ValueError(f"Unknown root type: {self.root.obj_type}")
+        root_obj = self.root.non_empty_object
+        hierarchy = _VISUAL_HIERARCHIES.get(type(root_obj))
+        if hierarchy is not None:
+            return hierarchy
+        # subclasses of the root types
+        for root_type, hierarchy in _VISUAL_HIERARCHIES.items():
+            if isinstance(root_obj, root_type):
+                return hierarchy
+        raise ValueError(f"Unknown root type: {self.root.obj_type}")
 
     @model_validator(mode="after")
     def make_dependents(self) -> Self:
@@ -900,28 +913,42 @@ class ObjectDiffBatch(SyftObject):
         return ""  # Turns off the _repr_markdown_ of SyftObject
 
     def _get_visual_hierarchy(
-        self, node: ObjectDiff, visited: set[UID] | None = None
+        self,
+        node: ObjectDiff,
+        visited: set[UID] | None = None,
+        child_types_map: dict | None = None,
+        diff_order: dict[UID, int] | None = None,
     ) -> dict[ObjectDiff, dict]:
         visited = visited if visited is not None else set()
         visited.add(node.object_id)
 
-        _, child_types_map = self.visual_hierarchy
+        if child_types_map is None:
+            _, child_types_map = self.visual_hierarchy
+        if diff_order is None:
+            diff_order = {uid: i for i, uid in enumerate(self.global_diffs)}
         child_types = child_types_map.get(node.obj_type, [])
         dep_ids = self.dependencies.get(node.object_id, []) + self.dependents.get(
             node.object_id, []
         )
+        # look the neighbours up directly, keeping the global_diffs order
+        dep_diffs = sorted(
+            (self.global_diffs[uid] for uid in set(dep_ids) if uid in diff_order),
+            key=lambda n: diff_order[n.object_id],
+        )
 
         result = {}
         for child_type in child_types:
             children = [
-                n
-                for n in self.global_diffs.values()
-                if n.object_id in dep_ids
-                and isinstance(n.low_obj or n.high_obj, child_type)
+                n for n in dep_diffs if isinstance(n.non_empty_object, child_type)
             ]
             for child in children:
                 if child.object_id not in visited:
-                    result[child] = self._get_visual_hierarchy(child, visited=visited)
+                    result[child] = self._get_visual_hierarchy(
+                        child,
+                        visited=visited,
+                        child_types_map=child_types_map,
+                        diff_order=diff_order,
+                    )
 
         return result
 
@@ -930,15 +957,18 @@ class ObjectDiffBatch(SyftObject):
         dependecies: list[ObjectDiff] = self.get_dependencies(include_roots=True)
         visual_root_type = self.visual_hierarchy[0]
 
-        visual_roots = [
-            diff
-            for diff in dependecies
-            if isinstance(diff.low_obj or diff.high_obj, visual_root_type)
-        ]
-        if not len(visual_roots):
+        visual_root = next(
+            (
+                diff
+                for diff in dependecies
+                if isinstance(diff.non_empty_object, visual_root_type)
+            ),
+            None,
+        )
+        if visual_root is None:
             raise ValueError("No visual root found")
 
-        return visual_roots[0]
+        return visual_root
 
     @property
     def user_code_high(self) -> UserCode | None:
@@ -959,7 +989,9 @@ class ObjectDiffBatch(SyftObject):
 
     def get_visual_hierarchy(self) -> dict[ObjectDiff, dict]:
         visual_root = self.visual_root
-        return {visual_root: self._get_visual_hierarchy(self.visual_root)}  # type: ignore
+        diff_order = {uid: i for i, uid in enumerate(self.global_diffs)}
+        hierarchy = self._get_visual_hierarchy(visual_root, diff_order=diff_order)
+        return {visual_root: hierarchy}  # type: ignore
 
     def _get_obj_str(self, diff_obj: ObjectDiff, level: int, side: str) -> str:
         obj = diff_obj.low_obj if side == "low" else diff_obj.high_obj
@@ -978,15 +1010,15 @@ class ObjectDiffBatch(SyftObject):
 """
 
     def hierarchy_str(self, side: str) -> str:
-        def _hierarchy_str_recursive(tree: dict, level: int) -> str:
-            result = ""
+        def _hierarchy_str_recursive(tree: dict, level: int, parts: list[str]) -> None:
             for node, children in tree.items():
-                result += self._get_obj_str(node, level, side)
-                result += _hierarchy_str_recursive(children, level + 1)
-            return result
+                parts.append(self._get_obj_str(node, level, side))
+                _hierarchy_str_recursive(children, level + 1, parts)
 
         visual_hierarchy = self.get_visual_hierarchy()
-        res = _hierarchy_str_recursive(visual_hierarchy, 0)
+        parts: list[str] = []
+        _hierarchy_str_recursive(visual_hierarchy, 0, parts)
+        res = "".join(parts)
         if res == "":
             res = f"No {side} side changes."
         return f"""{side.upper()} SIDE STATE:
@@ -1021,6 +1053,10 @@ class IgnoredBatchView(SyftObject):
                 other_batch.decision = None
 
 
+# Order of hierarchies within a usercode group, by root object type
+_HIERARCHY_ORDER: dict[type, int] = {UserCode: 0, Request: 1, Job: 2}
+
+
 class NodeDiff(SyftObject):
     __canonical_name__ = "NodeDiff"
     __version__ = SYFT_OBJECT_VERSION_2
@@ -1039,6 +1075,8 @@ class NodeDiff(SyftObject):
 
     include_ignored: bool = False
 
+    _diffs: list[ObjectDiff] | None = None
+
     def __getitem__(self, idx: Any) -> ObjectDiffBatch:
         return self.batches[idx]
 
@@ -1176,18 +1214,26 @@ It will be available for review again."""
     def dependencies_from_states(
         low_state: SyncState, high_state: SyncState
     ) -> dict[UID, list[UID]]:
-        dependencies = {}
-        all_parents = set(low_state.dependencies.keys()) | set(
-            high_state.dependencies.keys()
-        )
-        for parent in all_parents:
-            low_deps = low_state.dependencies.get(parent, [])
-            high_deps = high_state.dependencies.get(parent, [])
-            dependencies[parent] = list(set(low_deps) | set(high_deps))
-        return dependencies
+        low_deps = low_state.dependencies
+        high_deps = high_state.dependencies
+        # dict.fromkeys dedups in one pass and keeps the order of the dependencies
+        return {
+            parent: list(
+                dict.fromkeys(
+                    chain(low_deps.get(parent, ()), high_deps.get(parent, ()))
+                )
+            )
+            for parent in low_deps.keys() | high_deps.keys()
+        }
 
     @property
     def diffs(self) -> list[ObjectDiff]:
+        # batches and their dependency graphs are fixed once the NodeDiff is built
+        if self._diffs is None:
+            self._diffs = self._collect_diffs()
+        return self._diffs
+
+    def _collect_diffs(self) -> list[ObjectDiff]:
         diffs_depthfirst = [
             diff
             for hierarchy in self.batches
@@ -1229,36 +1275,27 @@ It will be available for review again."""
     @staticmethod
     def _sort_batches(hierarchies: list[ObjectDiffBatch]) -> list[ObjectDiffBatch]:
         without_usercode = []
-        grouped_by_usercode: dict[UID, list[ObjectDiffBatch]] = {}
+        grouped_by_usercode: dict[UID, list[ObjectDiffBatch]] = defaultdict(list)
         for hierarchy in hierarchies:
-            has_usercode = False
             for diff in hierarchy.get_dependencies(include_roots=True):
-                obj = diff.low_obj if diff.low_obj is not None else diff.high_obj
+                obj = diff.non_empty_object
                 if isinstance(obj, UserCode):
-                    usercode_id = obj.id
-                    if usercode_id not in grouped_by_usercode:
-                        grouped_by_usercode[usercode_id] = []
-                    grouped_by_usercode[usercode_id].append(hierarchy)
-                    has_usercode = True
+                    grouped_by_usercode[obj.id].append(hierarchy)
                     break
-            if not has_usercode:
+            else:
                 without_usercode.append(hierarchy)
 
-        # Order of hierarchies, by root object type
-        hierarchy_order = [UserCode, Request, Job]
-        # Sort group by hierarchy_order, then by root object id
+        # Sort group by root object type, then by root object id
         for hierarchy_group in grouped_by_usercode.values():
             hierarchy_group.sort(
                 key=lambda x: (
-                    hierarchy_order.index(x.root.obj_type),
+                    _HIERARCHY_ORDER[x.root.obj_type],
                     x.root.object_id,
                 )
             )
 
         # sorted = sorted groups + without_usercode
-        sorted_hierarchies = []
-        for grp in grouped_by_usercode.values():
-            sorted_hierarchies.extend(grp)
+        sorted_hierarchies = list(chain.from_iterable(grouped_by_usercode.values()))
         sorted_hierarchies.extend(without_usercode)
         return sorted_hierarchies
 
@@ -1274,7 +1311,7 @@ It will be available for review again."""
         root_ids = []
 
         for diff in obj_uid_to_diff.values():
-            diff_obj = diff.low_obj if diff.low_obj is not None else diff.high_obj
+            diff_obj = diff.non_empty_object
             if isinstance(diff_obj, Request | UserCode | TwinAPIEndpoint):
                 # TODO: Figure out nested user codes, do we even need that?
 
@@ -1396,6 +1433,17 @@ class ResolvedSyncState(SyftObject):
     unignored_batches: set[UID] = set()
     alias: str
 
+    # id indices mirroring the obj lists, so dedup in add_sync_instruction is O(1)
+    _create_ids: set[UID] = set()
+    _update_ids: set[UID] = set()
+    _delete_ids: set[UID] = set()
+
+    def __post_init__(self) -> None:
+        # private attrs are reset after validation, so seed the indices here
+        self._create_ids = {obj.id for obj in self.create_objs}
+        self._update_ids = {obj.id for obj in self.update_objs}
+        self._delete_ids = {obj.id for obj in self.delete_objs}
+
     @classmethod
     def from_client(cls, client: SyftClient) -> "ResolvedSyncState":
         alias: str = client.metadata.node_side_type  # type: ignore
@@ -1436,18 +1484,21 @@ class ResolvedSyncState(SyftObject):
         ):  # chose for the other
             if diff.status == "MODIFIED":
                 # keep IDs comparison here, otherwise it will break with actionobjects
-                if other_obj.id not in [x.id for x in self.update_objs]:  # type: ignore
+                if other_obj.id not in self._update_ids:  # type: ignore
+                    self._update_ids.add(other_obj.id)  # type: ignore
                     self.update_objs.append(other_obj)
 
             elif diff.status == "NEW":
                 if my_obj is None:
                     # keep IDs comparison here, otherwise it will break with actionobjects
-                    if other_obj.id not in [x.id for x in self.create_objs]:  # type: ignore
+                    if other_obj.id not in self._create_ids:  # type: ignore
+                        self._create_ids.add(other_obj.id)  # type: ignore
                         self.create_objs.append(other_obj)
 
                 elif other_obj is None:
                     # keep IDs comparison here, otherwise it will break with actionobjects
-                    if my_obj.id not in [x.id for x in self.delete_objs]:
+                    if my_obj.id not in self._delete_ids:
+                        self._delete_ids.add(my_obj.id)
                         self.delete_objs.append(my_obj)
 
         if self.alias == "low":
@@ -1485,23 +1536,36 @@ class ResolvedSyncState(SyftObject):
         )
 
 
+_console: Console | None = None
+
+
+def _get_console() -> Console:
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
+
+
 def display_diff_object(obj_state: str | None) -> Panel:
     if obj_state is None:
         return Panel(Markdown("None"), box=box.ROUNDED, expand=False)
+    # same rendering as a fenced python block in Markdown, without the markdown parse
     return Panel(
-        Markdown(f"```python\n{obj_state}\n```", code_theme="default"),
+        Syntax(obj_state, "python", theme="default", word_wrap=True, padding=1),
         box=box.ROUNDED,
         expand=False,
     )
 
 
 def display_diff_hierarchy(diff_hierarchy: list[tuple[ObjectDiff, int]]) -> None:
-    console = Console()
+    console = _get_console()
 
     for diff, level in diff_hierarchy:
         title = f"{diff.obj_type.__name__}({diff.object_id}) - State: {diff.status}"
 
-        low_side_panel = display_diff_object(diff.low_state if diff.low_obj else None)
+        low_side_panel = display_diff_object(
+            diff.low_state if diff.low_obj is not None else None
+        )
         low_side_panel.title = "Low side"
         low_side_panel.title_align = "left"
         high_side_panel = display_diff_object(
@@ -2,6 +2,7 @@
 from enum import Enum
 from enum import auto
 import html
+from itertools import chain
 from typing import Any
 from uuid import uuid4
 
@@ -68,24 +69,31 @@ colors = {
 }
 
 
+row_styles = {
+    status: f"background-color: {background_colors[status]}; color: {colors[status]}; display: block; white-space: pre-wrap; margin-bottom: 5px;"  # noqa: E501
+    for status in DiffStatus
+}
+
+
 def create_diff_html(
     title: str,
     properties: dict[str, str],
     statuses: dict[str, DiffStatus],
 ) -> str:
-    html_str = f"<div style='width: 100%;'>{title}<br>"
-    html_str += "<div style='font-family: monospace; border-left: 1px solid #B4B0BF; padding-left: 10px;'>"
+    parts = [
+        f"<div style='width: 100%;'>{title}<br>",
+        "<div style='font-family: monospace; border-left: 1px solid #B4B0BF; padding-left: 10px;'>",
+    ]
 
     for attr, val in properties.items():
-        status = statuses[attr]
+        style = row_styles[statuses[attr]]
         val = val if val is not None else ""
-        style = f"background-color: {background_colors[status]}; color: {colors[status]}; display: block; white-space: pre-wrap; margin-bottom: 5px;"  # noqa: E501
         content = html.escape(f"{attr}: {val}")
-        html_str += f"<div style='{style}'>{content}</div>"
+        parts.append(f"<div style='{style}'>{content}</div>")
 
-    html_str += "</div></div>"
+    parts.append("</div></div>")
 
-    return html_str
+    return "".join(parts)
 
 
 # TODO move CSS/HTML/JS outside function
@@ -101,7 +109,9 @@ class MainObjectDiffWidget:
     ):
         self.low_properties = diff.repr_attr_dict("low")
         self.high_properties = diff.repr_attr_dict("high")
-        self.statuses = diff.repr_attr_diffstatus_dict()
+        self.statuses = diff.repr_attr_diffstatus_dict(
+            self.low_properties, self.high_properties
+        )
         self.direction = direction
         self.diff: ObjectDiff = diff
         self.with_box = with_box
@@ -145,12 +155,14 @@ class MainObjectDiffWidget:
             return ""
 
     def build(self) -> widgets.HBox:
-        all_keys = list(self.low_properties.keys()) + list(self.high_properties.keys())
+        # one pass over the union of keys, in first-seen order
+        low_get = self.low_properties.get
+        high_get = self.high_properties.get
         low_properties = {}
         high_properties = {}
-        for k in all_keys:
-            low_properties[k] = self.low_properties.get(k, None)
-            high_properties[k] = self.high_properties.get(k, None)
+        for k in dict.fromkeys(chain(self.low_properties, self.high_properties)):
+            low_properties[k] = low_get(k)
+            high_properties[k] = high_get(k)
 
         if self.direction == SyncDirection.LOW_TO_HIGH:
             from_properties = low_properties
@@ -170,12 +182,10 @@ class MainObjectDiffWidget:
             f"To <i>{target_side}</i> (old values)", to_properties, self.statuses
         )
 
-        widget_from = widgets.HTML(
-            value=html_from, layout=widgets.Layout(width="50%", overflow="auto")
-        )
-        widget_to = widgets.HTML(
-            value=html_to, layout=widgets.Layout(width="50%", overflow="auto")
-        )
+        # Layouts are widgets too, share one between both columns
+        column_layout = widgets.Layout(width="50%", overflow="auto")
+        widget_from = widgets.HTML(value=html_from, layout=column_layout)
+        widget_to = widgets.HTML(value=html_to, layout=column_layout)
         css_accordion = """
             <style>
             .diff-container {
@@ -207,6 +217,10 @@ class CollapsableObjectDiffWidget:
         self.diff: ObjectDiff = diff
         self.sync: bool = False
         self.is_main_widget: bool = False
+        # the diff does not change, read on every build and sync decision
+        self.show_share_button: bool = isinstance(
+            diff.non_empty_object, SyftLog | ActionObject
+        )
         self.widget = self.build()
         self.set_and_disable_sync()
 
@@ -234,10 +248,6 @@ class CollapsableObjectDiffWidget:
             return Alert(message=message).to_html()
         return ""
 
-    @property
-    def show_share_button(self) -> bool:
-        return isinstance(self.diff.non_empty_object, SyftLog | ActionObject)
-
     @property
     def title(self) -> str:
         object = self.diff.non_empty_object
@@ -258,8 +268,10 @@ class CollapsableObjectDiffWidget:
         return second_line_html
 
     def set_and_disable_sync(self) -> None:
-        self._sync_checkbox.disabled = True
-        self._sync_checkbox.value = True
+        # send both trait changes to the frontend in one update
+        with self._sync_checkbox.hold_sync():
+            self._sync_checkbox.disabled = True
+            self._sync_checkbox.value = True
 
     def enable_sync(self) -> None:
         if self.show_sync_button:
@@ -368,13 +380,11 @@ class CollapsableObjectDiffWidget:
             layout=Layout(flex="1"),
         )
 
+        checkbox_layout = Layout(width="auto", margin="0 2px 0 0")
         share_private_data_checkbox = Checkbox(
-            description="Sync Real Data",
-            layout=Layout(width="auto", margin="0 2px 0 0"),
-        )
-        sync_checkbox = Checkbox(
-            description="Sync", layout=Layout(width="auto", margin="0 2px 0 0")
+            description="Sync Real Data", layout=checkbox_layout
         )
+        sync_checkbox = Checkbox(description="Sync", layout=checkbox_layout)
 
         checkboxes = []
         if show_share_private_checkbox:
@@ -387,8 +397,9 @@ class CollapsableObjectDiffWidget:
             layout=Layout(width="100%", justify_content="space-between"),
         )
 
-        accordion_body.add_class(body_id)
-        accordion_body.add_class("body-hidden")
+        with accordion_body.hold_sync():
+            accordion_body.add_class(body_id)
+            accordion_body.add_class("body-hidden")
 
         style = HTML(value=self.create_accordion_css(header_id, body_id, class_name))
 
@@ -588,7 +599,7 @@ class ResolveWidget:
         full_widget = widgets.VBox(
             [
                 self.build_header(),
-                self.main_object_diff_widget.widget,
+                main_object_diff_widget.widget,
                 self.spacer(8),
                 main_batch_items,
                 self.separator(),
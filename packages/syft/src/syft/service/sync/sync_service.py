@@ -65,32 +65,48 @@ class SyncService(AbstractService):
         store_to = context.node.get_service("actionservice").store  # type: ignore
         store_to_blob = context.node.get_service("blobstorageservice").stash.partition  # type: ignore
 
-        for permission in new_permissions:
-            if permission.permission == ActionPermission.READ:
-                store_to.add_permission(permission)
-
-                permission_blob = ActionObjectPermission(
+        read_permissions = [
+            permission
+            for permission in new_permissions
+            if permission.permission == ActionPermission.READ
+        ]
+        store_to.add_permissions(read_permissions)
+        store_to_blob.add_permissions(
+            [
+                ActionObjectPermission(
                     uid=blob_id,
                     permission=permission.permission,
                     credentials=permission.credentials,
                 )
-                store_to_blob.add_permission(permission_blob)
+                for permission in read_permissions
+            ]
+        )
 
     def set_obj_ids(self, context: AuthedServiceContext, x: Any) -> None:
-        if hasattr(x, "__dict__") and isinstance(x, SyftObject):
-            for val in x.__dict__.values():
+        # iterative walk, objects shared between attributes are only visited once
+        node_id = context.node.id  # type: ignore
+        credentials = context.credentials
+        stack = [x]
+        visited: set[int] = set()
+        while stack:
+            obj = stack.pop()
+            if not (hasattr(obj, "__dict__") and isinstance(obj, SyftObject)):
+                continue
+            if id(obj) in visited:
+                continue
+            visited.add(id(obj))
+
+            for val in obj.__dict__.values():
                 if isinstance(val, list | tuple):
-                    for v in val:
-                        self.set_obj_ids(context, v)
+                    stack.extend(val)
                 elif isinstance(val, dict):
-                    for v in val.values():
-                        self.set_obj_ids(context, v)
+                    stack.extend(val.values())
                 else:
-                    self.set_obj_ids(context, val)
-            x.syft_node_location = context.node.id  # type: ignore
-            x.syft_client_verify_key = context.credentials
-            if hasattr(x, "node_uid"):
-                x.node_uid = context.node.id  # type: ignore
+                    stack.append(val)
+            obj.syft_node_location = node_id
+            obj.syft_client_verify_key = credentials
+            if hasattr(obj, "node_uid"):
+                obj.node_uid = node_id
 
     def transform_item(
         self,
@@ -99,26 +115,35 @@ class SyncService(AbstractService):
     ) -> SyftObject:
         if isinstance(item, UserCodeStatusCollection):
             identity = NodeIdentity.from_node(context.node)
-            res = {}
-            for key in item.status_dict.keys():
-                # todo, check if they are actually only two nodes
-                res[identity] = item.status_dict[key]
-            item.status_dict = res
+            # todo, check if they are actually only two nodes
+            # every status is re-keyed to this node, so the last one wins
+            if item.status_dict:
+                last_status = next(reversed(item.status_dict.values()))
+                item.status_dict = {identity: last_status}
 
         self.set_obj_ids(context, item)
         return item
 
-    def get_stash_for_item(
-        self, context: AuthedServiceContext, item: SyftObject
-    ) -> BaseStash:
+    def get_stashes_by_type(
+        self, context: AuthedServiceContext
+    ) -> dict[type, BaseStash]:
         services = list(context.node.service_path_map.values())  # type: ignore
 
         all_stashes = {}
         for serv in services:
             if (_stash := getattr(serv, "stash", None)) is not None:
                 all_stashes[_stash.object_type] = _stash
+        return all_stashes
 
-        stash = all_stashes.get(type(item), None)
+    def get_stash_for_item(
+        self,
+        context: AuthedServiceContext,
+        item: SyftObject,
+        stashes_by_type: dict[type, BaseStash] | None = None,
+    ) -> BaseStash:
+        if stashes_by_type is None:
+            stashes_by_type = self.get_stashes_by_type(context)
+        stash = stashes_by_type.get(type(item), None)
         return stash
 
     def add_permissions_for_item(
@@ -131,9 +156,13 @@ class SyncService(AbstractService):
             raise ValueError("ActionObject permissions should be added separately")
         else:
             store = get_store(context, item)  # type: ignore
-            for permission in new_permissions:
-                if permission.permission == ActionPermission.READ:
-                    store.add_permission(permission)
+            store.add_permissions(
+                [
+                    permission
+                    for permission in new_permissions
+                    if permission.permission == ActionPermission.READ
+                ]
+            )
 
     def add_storage_permissions_for_item(
         self,
@@ -145,13 +174,14 @@ class SyncService(AbstractService):
         store.add_storage_permissions(new_permissions)
 
     def set_object(
-        self, context: AuthedServiceContext, item: SyncableSyftObject
+        self,
+        context: AuthedServiceContext,
+        item: SyncableSyftObject,
+        stashes_by_type: dict[type, BaseStash] | None = None,
     ) -> Result[SyftObject, str]:
-        stash = self.get_stash_for_item(context, item)
+        stash = self.get_stash_for_item(context, item, stashes_by_type)
         creds = context.credentials
 
-        exists = stash.get_by_uid(context.credentials, item.id).ok() is not None
-
         if isinstance(item, TwinAPIEndpoint):
             # we need the side effect of set function
             # to create an action object
@@ -163,6 +193,8 @@ class SyncService(AbstractService):
             else:
                 return Ok(item)
 
+        # only needed to pick update or set, so fetch after the early return above
+        exists = stash.get_by_uid(creds, item.id).ok() is not None
         if exists:
             res = stash.update(creds, item)
         else:
@@ -197,6 +229,9 @@ class SyncService(AbstractService):
         for storage_permission in storage_permissions:
             storage_permissions_dict[storage_permission.uid].append(storage_permission)
 
+        # the services of a node are fixed, look their stashes up once per sync
+        stashes_by_type = self.get_stashes_by_type(context)
+
         for item in items:
             new_permissions = permissions_dict[item.id.id]
             new_storage_permissions = storage_permissions_dict[item.id.id]
@@ -207,7 +242,7 @@ class SyncService(AbstractService):
                 )
             else:
                 item = self.transform_item(context, item)  # type: ignore[unreachable]
-                res = self.set_object(context, item)
+                res = self.set_object(context, item, stashes_by_type)
 
                 if res.is_ok():
                     self.add_permissions_for_item(context, item, new_permissions)
@@ -288,16 +323,15 @@ class SyncService(AbstractService):
         action_object_ids = set()
         for obj in all_items:
             if isinstance(obj, ExecutionOutput):
-                action_object_ids |= set(obj.output_id_list)
+                action_object_ids.update(obj.output_id_list)
             elif isinstance(obj, Job) and obj.result is not None:
                 if isinstance(obj.result, ActionObject):
                     obj.result = obj.result.as_empty()
                     action_object_ids.add(obj.result.id)
 
+        action_service = context.node.get_service("actionservice")  # type: ignore
         for uid in action_object_ids:
-            action_object = context.node.get_service("actionservice").get(
-                context, uid, resolve_nested=False
-            )  # type: ignore
+            action_object = action_service.get(context, uid, resolve_nested=False)
             if action_object.is_err():
                 return action_object
             all_items.append(action_object.ok())
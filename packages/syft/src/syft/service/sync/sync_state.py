@@ -25,11 +25,16 @@ from ...util.notebook_ui.styles import ITABLES_CSS
 from ..context import AuthedServiceContext
 
 
+_LEVEL_PREFIXES = ("",) + tuple("--" * level + " " for level in range(1, 16))
+
+
 def get_hierarchy_level_prefix(level: int) -> str:
-    if level == 0:
-        return ""
-    else:
-        return "--" * level + " "
+    if 0 <= level < len(_LEVEL_PREFIXES):
+        return _LEVEL_PREFIXES[level]
+    return "--" * level + " "
+
+
+_STATUS_BADGE_COLORS = {"NEW": "label-green", "SAME": "label-gray"}
 
 
 class SyncStateRow(SyftObject):
@@ -57,12 +62,7 @@ class SyncStateRow(SyftObject):
 
     def status_badge(self) -> dict[str, str]:
         status = self.status
-        if status == "NEW":
-            badge_color = "label-green"
-        elif status == "SAME":
-            badge_color = "label-gray"
-        else:
-            badge_color = "label-orange"
+        badge_color = _STATUS_BADGE_COLORS.get(status, "label-orange")
         return {"value": status.upper(), "type": badge_color}
 
     def _coll_repr_(self) -> dict[str, Any]:
@@ -91,30 +91,51 @@ class SyncStateRow(SyftObject):
         return f"{prefix}{type(self.object).__name__}"
 
 
+_PERIODS = (
+    ("year", 60 * 60 * 24 * 365),
+    ("month", 60 * 60 * 24 * 30),
+    ("day", 60 * 60 * 24),
+    ("hour", 60 * 60),
+    ("minute", 60),
+    ("second", 1),
+)
+
+
 def td_format(td_object: timedelta) -> str:
     seconds = int(td_object.total_seconds())
     if seconds == 0:
         return "0 seconds"
 
-    periods = [
-        ("year", 60 * 60 * 24 * 365),
-        ("month", 60 * 60 * 24 * 30),
-        ("day", 60 * 60 * 24),
-        ("hour", 60 * 60),
-        ("minute", 60),
-        ("second", 1),
-    ]
-
     strings = []
-    for period_name, period_seconds in periods:
+    for period_name, period_seconds in _PERIODS:
         if seconds >= period_seconds:
             period_value, seconds = divmod(seconds, period_seconds)
             has_s = "s" if period_value > 1 else ""
             strings.append(f"{period_value} {period_name}{has_s}")
+            if not seconds:
+                break
 
     return ", ".join(strings)
 
 
+_REPR_HTML_STYLE_PRE = f"""
+        <style>
+            {FONT_CSS}
+            .syft-syncstate {{color: """
+_REPR_HTML_STYLE_POST = f""";}}
+            .syft-syncstate h3,
+            .syft-syncstate p
+              {{font-family: 'Open Sans';}}
+              {ITABLES_CSS}
+            </style>
+        <div class='syft-syncstate'>
+            <p style="margin-bottom:16px;"></p>
+            """
+_REPR_HTML_POST = """
+        </div>
+"""
+
+
 @serializable()
 class SyncState(SyftObject):
     __canonical_name__ = "SyncState"
@@ -135,6 +156,7 @@ class SyncState(SyftObject):
     # NOTE importing NodeDiff annotation with TYPE_CHECKING does not work here,
     # since typing.get_type_hints does not check for TYPE_CHECKING-imported types
     _previous_state_diff: Any = None
+    _rows_cache: list[SyncStateRow] | None = None
 
     __attr_searchable__ = ["created_at"]
 
@@ -154,6 +176,7 @@ class SyncState(SyftObject):
         self._previous_state_diff = NodeDiff.from_sync_state(
             previous_state, self, _include_node_status=False, direction=None
         )
+        self._rows_cache = None
 
     def get_previous_state_diff(self) -> Any:
         if self._previous_state_diff is None:
@@ -184,43 +207,52 @@ class SyncState(SyftObject):
     def add_objects(
         self, objects: list[SyncableSyftObject], context: AuthedServiceContext
     ) -> None:
-        for obj in objects:
-            if isinstance(obj.id, LineageID):
-                self.objects[obj.id.id] = obj
-            else:
-                self.objects[obj.id] = obj
+        self.objects.update(
+            (obj.id.id if type(obj.id) is LineageID else obj.id, obj) for obj in objects
+        )
 
         # TODO might get slow with large states,
         # need to build dependencies every time to not have UIDs
         # in dependencies that are not in objects
         self._build_dependencies(context=context)
+        self._previous_state_diff = None
+        self._rows_cache = None
 
     def _build_dependencies(self, context: AuthedServiceContext) -> None:
-        self.dependencies = {}
+        dependencies = {}
 
-        all_ids = self.all_ids
+        all_ids = self.objects.keys()
         for obj in self.objects.values():
-            if hasattr(obj, "get_sync_dependencies"):
-                deps = obj.get_sync_dependencies(context=context)
+            get_sync_dependencies = getattr(obj, "get_sync_dependencies", None)
+            if get_sync_dependencies is not None:
+                deps = get_sync_dependencies(context=context)
                 deps = [d.id for d in deps if d.id in all_ids]  # type: ignore
                 # TODO: Why is this en check here? here?
-                if len(deps):
-                    self.dependencies[obj.id.id] = deps
+                if deps:
+                    dependencies[obj.id.id] = deps
+
+        self.dependencies = dependencies
 
     @property
     def rows(self) -> list[SyncStateRow]:
-        result = []
-        ids = set()
+        if self._rows_cache is not None:
+            return self._rows_cache
 
         previous_diff = self.get_previous_state_diff()
         if previous_diff is None:
             raise ValueError("No previous state to compare to")
+
+        # one row per root object, keeping the first batch it appears in
+        batches_by_root: dict[UID, Any] = {}
         for batch in previous_diff.batches:
+            batches_by_root.setdefault(batch.root_diff.object_id, batch)
+
+        result = []
+        for batch in batches_by_root.values():
             diff = batch.root_diff
-            if diff.object_id in ids:
-                continue
-            ids.add(diff.object_id)
-            row = SyncStateRow(
+            # rows are only rendered, so skip pydantic validation
+            row = SyncStateRow.model_construct(
+                id=UID(),
                 object=diff.high_obj,
                 previous_object=diff.low_obj,
                 current_state=diff.diff_side_str("high"),
@@ -230,6 +262,7 @@ class SyncState(SyftObject):
                 last_sync_date=diff.last_sync_date,
             )
             result.append(row)
+        self._rows_cache = result
         return result
 
     def _repr_html_(self) -> str:
@@ -248,21 +281,14 @@ class SyncState(SyftObject):
         else:
             date_html = prop_template.format("last sync", "not synced yet")
 
-        repr = f"""
-        <style>
-            {FONT_CSS}
-            .syft-syncstate {{color: {SURFACE[options.color_theme]};}}
-            .syft-syncstate h3,
-            .syft-syncstate p
-              {{font-family: 'Open Sans';}}
-              {ITABLES_CSS}
-              {{font-family: 'Open Sans';}}
-              {ITABLES_CSS}
-            </style>
-        <div class='syft-syncstate'>
-            <p style="margin-bottom:16px;"></p>
-            {name_html}
-            {date_html}
-        </div>
-"""
-        return repr + self.rows._repr_html_()
+        return "".join(
+            (
+                _REPR_HTML_STYLE_PRE,
+                SURFACE[options.color_theme],
+                _REPR_HTML_STYLE_POST,
+                name_html,
+                date_html,
+                _REPR_HTML_POST,
+                self.rows._repr_html_(),
+            )
+        )
@@ -642,6 +642,8 @@ class SyftObject(SyftBaseObject, SyftObjectRegistry, SyftMigrationRegistry):
     def syft_eq(self, ext_obj: Self | None) -> bool:
         if ext_obj is None:
             return False
+        if ext_obj is self:
+            return True
         attrs_to_check = self.__dict__.keys()
 
         obj_exclude_attrs = getattr(self, "__exclude_sync_diff_attrs__", [])
@@ -668,6 +670,9 @@ class SyftObject(SyftBaseObject, SyftObjectRegistry, SyftMigrationRegistry):
         if self.id != ext_obj.id:
             raise Exception("Not the same id for low side and high side requests")
 
+        if ext_obj is self:
+            return diff_attrs
+
         attrs_to_check = self.__dict__.keys()
 
         obj_exclude_attrs = getattr(self, "__exclude_sync_diff_attrs__", [])
@@ -690,7 +695,9 @@ class SyftObject(SyftBaseObject, SyftObjectRegistry, SyftMigrationRegistry):
                         cmp = obj_attr.syft_eq
 
                     if not cmp(ext_obj_attr):
-                        diff_attr = AttrDiff(
+                        # values are taken as-is from both objects, skip validation
+                        diff_attr = AttrDiff.model_construct(
+                            id=UID(),
                             attr_name=attr,
                             low_attr=obj_attr,
                             high_attr=ext_obj_attr,
@@ -152,7 +152,7 @@ class UID:
 
     @property
     def no_dash(self) -> str:
-        return str(self.value).replace("-", "")
+        return self.value.hex
 
     def __repr__(self) -> str:
         """Returns a human-readable version of the ID
@@ -241,9 +241,10 @@ class LineageID(UID):
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, LineageID):
-            return (
-                self.id == other.id
-                and self.syft_history_hash == other.syft_history_hash
+            # same as comparing .id, without building two UIDs
+            return (self.value, self.syft_history_hash) == (
+                other.value,
+                other.syft_history_hash,
             )
         elif isinstance(other, UID):
             return hash(self) == hash(other)
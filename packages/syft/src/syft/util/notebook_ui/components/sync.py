@@ -1,4 +1,5 @@
 # stdlib
+from collections.abc import Callable
 from typing import Any
 
 # third party
@@ -80,6 +81,18 @@ class CopyIDButton(CopyButton):
         return f"#{copy_text}"
 
 
+_SUMMARY_HTML_PRE = (
+    '<div style="display: flex; gap: 8px; justify-content: space-between; '
+    'width: 100%; overflow: hidden; align-items: center;">'
+    '<div style="display: flex; gap: 8px; justify-content: start; align-items: center;">'
+)
+_SUMMARY_HTML_MID = "</div>"
+_SUMMARY_HTML_FOOTER = (
+    "</div><div style=\"display: table-row\"><span class='syncstate-col-footer'>"
+)
+_SUMMARY_HTML_POST = "</span></div>"
+
+
 class SyncTableObject(HTMLComponentBase):
     __canonical_name__ = "SyncTableObject"
     __version__ = SYFT_OBJECT_VERSION_1
@@ -102,33 +115,35 @@ class SyncTableObject(HTMLComponentBase):
         return ""  # type: ignore
 
     def to_html(self) -> str:
-        type_html = TypeLabel(object=self.object).to_html()
-
         type_html = TypeLabel(object=self.object).to_html()
         description_html = MainDescription(object=self.object).to_html()
         copy_id_button = CopyIDButton(
             copy_text=str(self.object.id.id), max_width=60
         ).to_html()
+        copy_id_button = copy_id_button.replace("\n", "").replace("    ", "")
 
         updated_delta_str = "29m ago"
         updated_by = "john@doe.org"
         status_str = self.get_status_str()
         status_seperator = " • " if len(status_str) else ""
-        summary_html = f"""
-            <div style="display: flex; gap: 8px; justify-content: space-between; width: 100%; overflow: hidden; align-items: center;">
-            <div style="display: flex; gap: 8px; justify-content: start; align-items: center;">
-            {type_html} {description_html}
-            </div>
-            {copy_id_button}
-            </div>
-            <div style="display: table-row">
-            <span class='syncstate-col-footer'>
-            {status_str}{status_seperator}Updated by {updated_by} {updated_delta_str}
-            </span>
-            </div>
-        """  # noqa: E501
-        summary_html = summary_html.replace("\n", "").replace("    ", "")
-        return summary_html
+        return "".join(
+            (
+                _SUMMARY_HTML_PRE,
+                type_html,
+                " ",
+                description_html,
+                _SUMMARY_HTML_MID,
+                copy_id_button,
+                _SUMMARY_HTML_FOOTER,
+                status_str,
+                status_seperator,
+                "Updated by ",
+                updated_by,
+                " ",
+                updated_delta_str,
+                _SUMMARY_HTML_POST,
+            )
+        )
 
 
 ALERT_CSS = """
@@ -193,6 +208,14 @@ class Label(HTMLComponentBase):
         return f'<span class="label {self.label_class}">{value}</span>'
 
 
+_TYPE_LABEL_CLASSES: dict[type, str] = {
+    UserCode: "label-light-blue",
+    Job: "label-light-blue",
+    # TODO: handle other requests
+    Request: "label-light-purple",
+}
+
+
 class TypeLabel(Label):
     __canonical_name__ = "TypeLabel"
     __version__ = SYFT_OBJECT_VERSION_1
@@ -208,14 +231,15 @@ class TypeLabel(Label):
 
     @staticmethod
     def type_label_class(obj: Any) -> str:
-        if isinstance(obj, UserCode):
-            return "label-light-blue"
-        elif isinstance(obj, Job):  # type: ignore
-            return "label-light-blue"
-        elif isinstance(obj, Request):  # type: ignore
-            # TODO: handle other requests
-            return "label-light-purple"
-        return "label-light-blue"  # type: ignore
+        return _TYPE_LABEL_CLASSES.get(type(obj), "label-light-blue")
+
+
+_DESCRIPTIONS: dict[type, Callable[[Any], str]] = {
+    UserCode: lambda obj: obj.service_func_name,
+    Job: lambda obj: obj.user_code_name or "",
+    # TODO: handle other requests
+    Request: lambda obj: f"Execute {obj.code.service_func_name}",
+}
 
 
 class MainDescription(HTMLComponentBase):
@@ -224,19 +248,10 @@ class MainDescription(HTMLComponentBase):
     object: SyftObject
 
     def main_object_description_str(self) -> str:
-        if isinstance(self.object, UserCode):
-            return self.object.service_func_name
-        elif isinstance(self.object, Job):  # type: ignore
-            return self.object.user_code_name or ""
-        elif isinstance(self.object, Request):  # type: ignore
-            # TODO: handle other requests
-            return f"Execute {self.object.code.service_func_name}"
-        # SyftLog
-        # ExecutionOutput
-        # ActionObject
-        # UserCodeStatusCollection
-
-        return ""  # type: ignore
+        # SyftLog, ExecutionOutput, ActionObject and UserCodeStatusCollection
+        # have no description
+        describe = _DESCRIPTIONS.get(type(self.object))
+        return describe(self.object) if describe is not None else ""
 
     def to_html(self) -> str:
         return f'<span class="syncstate-description">{self.main_object_description_str()}</span>'
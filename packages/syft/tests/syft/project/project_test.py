@@ -4,6 +4,7 @@ import pytest
 
 # syft absolute
 import syft as sy
+from syft.service.project.project import PROJECT_OWNER_TAG
 from syft.service.project.project import Project
 
 
@@ -31,6 +32,9 @@ def test_project_creation(worker):
     assert project.users[0].verify_key == ds_client.verify_key
     assert project.name == "My Cool Project"
     assert project.description == "My Cool Description"
+    assert project.project_permissions == frozenset(
+        {PROJECT_OWNER_TAG + bytes(root_client.verify_key.verify_key)}
+    )
 
 
 def test_error_data_owner_project_creation(worker):
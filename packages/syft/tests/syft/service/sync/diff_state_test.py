@@ -0,0 +1,26 @@
+# syft absolute
+from syft.service.sync.diff_state import ListDiff
+
+
+def test_list_diff_from_lists():
+    diff = ListDiff.from_lists("attr", [1, 2, 3, 4], [1, 5, 3])
+    assert diff.diff_ids == [1]
+    assert diff.new_low_ids == [3]
+    assert diff.new_high_ids == []
+
+
+def test_list_diff_from_long_lists():
+    low = list(range(100))
+    high = list(range(100))
+    high[3] = -1
+    high[70] = -1
+    diff = ListDiff.from_lists("attr", low, high + [100])
+    assert diff.diff_ids == [3, 70]
+    assert diff.new_high_ids == [100]
+
+    # elements compare with python equality
+    low = [1] * 50
+    high = [1] * 49 + [True]
+    assert ListDiff.from_lists("attr", low, high).diff_ids == []
+    high = [1] * 49 + ["1"]
+    assert ListDiff.from_lists("attr", low, high).diff_ids == [49]